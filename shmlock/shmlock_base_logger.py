@@ -7,10 +7,6 @@ Potentially make this an own package or at least own repo since the related test
 do with the shmlock anymore.
 """
 import logging
-try:
-    import coloredlogs
-except ModuleNotFoundError:
-    coloredlogs = None
 from shmlock.shmlock_exceptions import ShmLockValueError
 
 
@@ -82,9 +78,15 @@ def create_logger(name: str = "ShmLockLogger",
         file_handler.setFormatter(logger_format)
         logger.addHandler(file_handler)
 
-    if use_colored_logs and coloredlogs is not None:
-        # set colored logs if available
-        coloredlogs.install(logger=logger, level=level, fmt=fmt)
+    if use_colored_logs:
+        # set colored logs if available; NOTE that coloredlogs is imported lazily since its import
+        # is comparatively slow and it is not needed if colored logs are not used
+        try:
+            import coloredlogs # pylint: disable=(import-outside-toplevel)
+        except ImportError:
+            coloredlogs = None
+        if coloredlogs is not None:
+            coloredlogs.install(logger=logger, level=level, fmt=fmt)
 
     return logger
 
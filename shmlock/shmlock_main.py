@@ -36,7 +36,7 @@ __all__ = ["ShmLock",
 
 # reveal functions for resource tracking adjustments
 import shmlock.shmlock_exceptions as exceptions
-from shmlock.shmlock_monkey_patch import remove_shm_from_resource_tracker
+from shmlock.shmlock_monkey_patch import remove_shm_from_resource_tracker, _IS_POSIX
 from shmlock.shmlock_base_logger import ShmModuleBaseLogger, create_logger
 from shmlock.shmlock_uuid import ShmUuid
 from shmlock.shmlock_config import ShmLockConfig, ExitEventMock
@@ -44,7 +44,7 @@ from shmlock.shmlock_warnings import ShmLockDanglingSharedMemoryWarning, \
                                      ShmMemoryBarrierMissingWarning
 
 
-if os.name == "nt":
+if not _IS_POSIX:
     try:
         import win32api # pylint: disable=import-error
         import win32con # pylint: disable=import-error
@@ -110,6 +110,7 @@ class ShmLock(ShmModuleBaseLogger):
             class, by default None
         """
         self._shm = threading.local() # will contain shared memory reference and counter
+        self._exit_handlers = set() # names of exit handlers added via add_exit_handlers()
         super().__init__(logger=logger)
 
         # type checks
@@ -878,6 +879,12 @@ class ShmLock(ShmModuleBaseLogger):
         NOTE that there is still the possibility that the shared memory has been acquired but
         the process is terminated before the shared memory object has been returned.
 
+        NOTE that each handler type is only registered once per lock instance, i.e. calling this
+        function multiple times neither chains the signal handler of this lock onto itself nor
+        registers duplicate atexit/weakref handlers. Previously set signal handlers are called
+        after the lock has been released (only the one set for the received signal). If that
+        handler is the default handler, the process exits via sys.exit(128 + signum).
+
         Parameters
         ----------
         register_atexit : bool, optional
@@ -893,12 +900,12 @@ class ShmLock(ShmModuleBaseLogger):
         call_gc : bool, optional
             call garbage collector to clean up the shared memory, by default True
         """
-        if os.name == "posix" and register_signal:
+        if _IS_POSIX and register_signal and "signal" not in self._exit_handlers:
 
             # get potentially existing signal handlers
-            existing_handlers_sigint = signal.getsignal(signal.SIGINT)
-            existing_handlers_sigterm = signal.getsignal(signal.SIGTERM)
-            existing_handlers_sighup = signal.getsignal(signal.SIGHUP)
+            existing_handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGINT,
+                                                                        signal.SIGTERM,
+                                                                        signal.SIGHUP,)}
 
             def clean_up(signum, frame):
                 """
@@ -906,21 +913,24 @@ class ShmLock(ShmModuleBaseLogger):
                 """
                 self.release(force=True)
 
-                # call existing handlers if they are callable
-                if callable(existing_handlers_sigint):
-                    existing_handlers_sigint(signum, frame)
-                if callable(existing_handlers_sigterm):
-                    existing_handlers_sigterm(signum, frame)
-                if callable(existing_handlers_sighup):
-                    existing_handlers_sighup(signum, frame)
+                # chain to the handler which had been set for the received signal
+                existing_handler = existing_handlers.get(signum)
+                if callable(existing_handler):
+                    existing_handler(signum, frame)
+                elif existing_handler == signal.SIG_DFL:
+                    # default behavior is termination; exit via SystemExit (instead of re-raising
+                    # the signal) so that finally blocks, atexit handlers (e.g. of other locks)
+                    # and destructors are still executed. exit code as for termination by signal
+                    sys.exit(128 + signum)
 
             # register signal handlers
-            signal.signal(signal.SIGINT, clean_up)
-            signal.signal(signal.SIGTERM, clean_up)
-            signal.signal(signal.SIGHUP, clean_up)
+            for sig in existing_handlers:
+                signal.signal(sig, clean_up)
+            self._exit_handlers.add("signal")
 
 
-        if os.name == "nt" and register_console_handler:
+        if not _IS_POSIX and register_console_handler and \
+            "console_handler" not in self._exit_handlers:
             if win32api is not None and win32con is not None:
                 # only for windows systems which us necessary if a console is closed
                 def console_handler(ctrl_type):
@@ -933,21 +943,24 @@ class ShmLock(ShmModuleBaseLogger):
                     return False  # Continue default behavior
 
                 win32api.SetConsoleCtrlHandler(console_handler, True)
+                self._exit_handlers.add("console_handler")
             else:
                 self.error("win32api or win32con is not available. "\
                            "Cannot register console handler for lock %s. "\
                            "Make sure you have the pywin32 package installed.",
                            self)
 
-        if register_weakref:
+        if register_weakref and "weakref" not in self._exit_handlers:
             # register weakref handler to clean up the shared memory
             weakref.finalize(self, self.release, force=True)
+            self._exit_handlers.add("weakref")
 
-        if register_atexit:
+        if register_atexit and "atexit" not in self._exit_handlers:
             # register atexit handler to close the shared memory queue
             # usually this should not be necessary since the usage of signal and weakref, but
             # safe is safe
             atexit.register(self.release, force=True)
+            self._exit_handlers.add("atexit")
 
         if call_gc:
             # call garbage collector
@@ -19,11 +19,54 @@ import threading
 from multiprocessing import resource_tracker
 
 
+# os.name does not change during the process lifetime
+_IS_POSIX = os.name == "posix"
+
 # create list to store all patterns so that the monkey patch can be used multiple times
 _PATTERN_LIST = []
+# immutable snapshot of _PATTERN_LIST which is read by the replacement functions without locking.
+# it is re-published (module global rebind) after each append to _PATTERN_LIST
+_PATTERN_TUPLE = ()
 # use a locks to make the monkey patch thread-safe. NOTE that each process does have its own
 # resource_tracker instance so we do not need to lock across processes
-_THREADING_LOCK = threading.RLock()
+_THREADING_LOCK = threading.Lock()
+# whether resource_tracker.register/unregister have already been replaced by the functions below
+_PATCHED = False
+
+# warnings of remove_shm_from_resource_tracker are only emitted once per process
+_WARNING_NON_POSIX = "remove_shm_from_resource_tracker is (probably) "\
+                     "not necessary on non-posix systems"
+_WARNING_EMPTY_PATTERN = "empty pattern used in function remove_shm_from_resource_tracker. "\
+                         "This will remove the cleanup function for shared memory. "\
+                         "This can lead to memory leaks if shared memory is not unlinked "\
+                         "manually. Use with caution"
+_WARNED_NON_POSIX = False
+_WARNED_EMPTY_PATTERN = False
+
+
+# NOTE that the bound methods of the (per process) resource tracker instance are bound as default
+# arguments so that they are looked up only once and not on each register/unregister call
+def _fix_register(name: str, rtype,
+                  orig_register=resource_tracker._resource_tracker.register): # pylint: disable=protected-access
+    """
+    replacement for resource_tracker.register which skips names matching any pattern
+    """
+    # check if pattern contained in any of the elements within _PATTERN_TUPLE
+    if any(pattern in name for pattern in _PATTERN_TUPLE):
+        return None
+    return orig_register(name, rtype)
+
+
+def _fix_unregister(name: str, rtype,
+                    orig_unregister=resource_tracker._resource_tracker.unregister): # pylint: disable=protected-access
+    """
+    replacement for resource_tracker.unregister which skips names matching any pattern
+    """
+    # check if pattern contained in any of the elements within _PATTERN_TUPLE
+    if any(pattern in name for pattern in _PATTERN_TUPLE):
+        return None
+    return orig_unregister(name, rtype)
+
 
 def remove_shm_from_resource_tracker(pattern: str, print_warning: bool = True):
     """
@@ -53,7 +96,8 @@ def remove_shm_from_resource_tracker(pattern: str, print_warning: bool = True):
         see any warnings from it. NOTE that this also increases performance on posix systems
         since the un-registering of the shared memory does not happen any longer
     print_warning : bool, optional
-        whether to print warnings if the function is called on non-posix systems, default is True
+        whether to print warnings if the function is called on non-posix systems or with an
+        empty pattern. Each warning is only emitted once per process, default is True
     """
 
     if sys.version_info >= (3, 13):
@@ -65,35 +109,32 @@ def remove_shm_from_resource_tracker(pattern: str, print_warning: bool = True):
     if not isinstance(pattern, str):
         raise ValueError("pattern must be a string")
 
-    if os.name != "posix" and print_warning:
-        warnings.warn("remove_shm_from_resource_tracker is (probably) "\
-                      "not necessary on non-posix systems", stacklevel=2)
-
-    if not pattern and print_warning:
-        warnings.warn("empty pattern used in function remove_shm_from_resource_tracker. "\
-                      "This will remove the cleanup function for shared memory. "\
-                      "This can lead to memory leaks if shared memory is not unlinked manually. "\
-                      "Use with caution", stacklevel=2)
+    # pylint: disable=(global-statement)
+    global _PATCHED, _PATTERN_TUPLE, _WARNED_NON_POSIX, _WARNED_EMPTY_PATTERN
 
     # NOTE that this function is not process-safe. This is because each proces should have its
     # on resource tracker instance. A check has yet to be implemented
     with _THREADING_LOCK:
-        _PATTERN_LIST.append(pattern)
+        # warned flags are checked and set within the lock so that concurrent calls from
+        # multiple threads do not emit the same warning more than once
+        if not _IS_POSIX and print_warning and not _WARNED_NON_POSIX:
+            warnings.warn(_WARNING_NON_POSIX, stacklevel=2)
+            _WARNED_NON_POSIX = True
+
+        if not pattern and print_warning and not _WARNED_EMPTY_PATTERN:
+            warnings.warn(_WARNING_EMPTY_PATTERN, stacklevel=2)
+            _WARNED_EMPTY_PATTERN = True
 
-        def fix_register(name: str, rtype):
-            # check if pattern contained in any of the elements within _PATTERN_LIST
-            if any(pattern in name for pattern in _PATTERN_LIST):
-                return None
-            return resource_tracker._resource_tracker.register(name, rtype) # pylint: disable=protected-access
-        resource_tracker.register = fix_register
+        _PATTERN_LIST.append(pattern)
+        _PATTERN_TUPLE = tuple(_PATTERN_LIST)
 
-        def fix_unregister(name: str, rtype):
-            # check if pattern contained in any of the elements within _PATTERN_LIST
-            if any(pattern in name for pattern in _PATTERN_LIST):
-                return None
-            return resource_tracker._resource_tracker.unregister(name, rtype) # pylint: disable=protected-access
-        resource_tracker.unregister = fix_unregister
+        # the replacement functions read _PATTERN_TUPLE on each call so they only have to be
+        # assigned once; subsequent calls solely extend the pattern list
+        if not _PATCHED:
+            resource_tracker.register = _fix_register
+            resource_tracker.unregister = _fix_unregister
+            _PATCHED = True
 
         # if pattern == "", we completely remove the cleanup function for shared memory
-        if not pattern and "shared_memory" in resource_tracker._CLEANUP_FUNCS: # pylint: disable=protected-access
-            del resource_tracker._CLEANUP_FUNCS["shared_memory"] # pylint: disable=protected-access
+        if not pattern:
+            resource_tracker._CLEANUP_FUNCS.pop("shared_memory", None) # pylint: disable=protected-access
@@ -2,19 +2,100 @@
 uuid class of shared memory lock.
 """
 import uuid
+import secrets
+
+UUID_BYTES_LENGTH = 16 # length of the byte representation of a uuid
+UUID_STR_LENGTH = 36 # length of the canonical (hyphenated) string representation of a uuid
 
 class ShmUuid:
     """
     data class to store the uuid of the lock
     """
 
+    # no per-instance __dict__; one uuid object is created for each lock
+    __slots__ = ("_uuid", "_hash", "_uuid_bytes", "_uuid_str")
+
     def __init__(self):
-        self.uuid_ = uuid.uuid4()
-        self.uuid_bytes = self.uuid_.bytes
-        self.uuid_str = str(self.uuid_)
+        # 16 random bytes (version 4 uuid) are sufficient as identifier of the lock; an uuid.UUID
+        # object (and the string representation) is only created if requested
+        random_bytes = bytearray(secrets.token_bytes(UUID_BYTES_LENGTH))
+        # set version (4) and variant (RFC 4122) bits as done by uuid.uuid4()
+        random_bytes[6] = random_bytes[6] & 0x0f | 0x40
+        random_bytes[8] = random_bytes[8] & 0x3f | 0x80
+        self._uuid_bytes = bytes(random_bytes)
+        self._hash = int.from_bytes(self._uuid_bytes[:8], "little")
+        self._uuid = None
+        self._uuid_str = None
 
     def __repr__(self):
-        return f"ShmUuid(uuid={self.uuid_})"
+        return f"ShmUuid(uuid={self.uuid_str})"
+
+    def __eq__(self, other):
+        """
+        two uuid objects are equal if their byte representations are equal
+
+        Returns
+        -------
+        bool
+            True if uuids are equal, False otherwise
+        """
+        if self is other:
+            # fast path; most comparisons are against the very same instance
+            return True
+        if not isinstance(other, ShmUuid):
+            return NotImplemented
+        return self.uuid_bytes == other.uuid_bytes
+
+    def __hash__(self):
+        """
+        hash of the uuid (precomputed at initialization from the first 8 random bytes)
+
+        Returns
+        -------
+        int
+            hash of the uuid
+        """
+        return self._hash
+
+    @property
+    def uuid_(self) -> uuid.UUID:
+        """
+        uuid object of the uuid (created once on first access)
+
+        Returns
+        -------
+        uuid.UUID
+            uuid object
+        """
+        if self._uuid is None:
+            self._uuid = uuid.UUID(bytes=self._uuid_bytes)
+        return self._uuid
+
+    @property
+    def uuid_bytes(self) -> bytes:
+        """
+        byte representation of the uuid
+
+        Returns
+        -------
+        bytes
+            byte representation of the uuid
+        """
+        return self._uuid_bytes
+
+    @property
+    def uuid_str(self) -> str:
+        """
+        string representation of the uuid (computed once on first access)
+
+        Returns
+        -------
+        str
+            string representation of the uuid
+        """
+        if self._uuid_str is None:
+            self._uuid_str = ShmUuid.byte_to_string(self._uuid_bytes)
+        return self._uuid_str
 
     @staticmethod
     def byte_to_string(byte_repr: bytes) -> str:
@@ -30,8 +111,20 @@ class ShmUuid:
         -------
         str
             string representation of uuid
+
+        Raises
+        ------
+        ValueError
+            if byte representation does not have a length of 16 bytes
         """
-        return str(uuid.UUID(bytes=byte_repr))
+        # NOTE that we do not construct an uuid.UUID object here; the canonical string is
+        # formatted directly from the hex representation (same format as str(uuid.UUID))
+        if len(byte_repr) != UUID_BYTES_LENGTH:
+            raise ValueError(f"byte representation of uuid must have a length of "\
+                             f"{UUID_BYTES_LENGTH} bytes, got {len(byte_repr)}")
+        hex_repr = byte_repr.hex()
+        return f"{hex_repr[:8]}-{hex_repr[8:12]}-{hex_repr[12:16]}-"\
+               f"{hex_repr[16:20]}-{hex_repr[20:]}"
 
     @staticmethod
     def string_to_bytes(uuid_str: str) -> bytes:
@@ -47,8 +140,22 @@ class ShmUuid:
         -------
         bytes
             byte representation of uuid
+
+        Raises
+        ------
+        ValueError
+            if string is not a canonical (hyphenated) uuid string
         """
-        return uuid.UUID(uuid_str).bytes
+        # NOTE that only the canonical format xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx (as returned
+        # by byte_to_string) is supported
+        if len(uuid_str) != UUID_STR_LENGTH or \
+            not uuid_str[8] == uuid_str[13] == uuid_str[18] == uuid_str[23] == "-":
+            raise ValueError(f"badly formed uuid string {uuid_str!r}")
+        byte_repr = bytes.fromhex(uuid_str.replace("-", ""))
+        if len(byte_repr) != UUID_BYTES_LENGTH:
+            # bytes.fromhex() skips whitespace so we have to check the resulting length
+            raise ValueError(f"badly formed uuid string {uuid_str!r}")
+        return byte_repr
 
     def __str__(self):
         """
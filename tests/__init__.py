@@ -0,0 +1,28 @@
+"""
+shared helpers for the tests of shmlock package
+"""
+import itertools
+import os
+import time
+
+# counter to assure unique shared memory names within this process. NOTE that the name is kept
+# short since e.g. macOS limits shared memory names to 31 characters
+_NAME_CTR = itertools.count()
+
+def unique_shm_name() -> str:
+    """
+    get a shared memory name which is unique for this process and test run
+    """
+    return f"shm_{os.getpid()}_{next(_NAME_CTR)}_{time.monotonic_ns() % 10**9}"
+
+
+def pid_shm_name(prefix: str) -> str:
+    """
+    get a shared memory name with fixed prefix which is unique per test run (process)
+
+    NOTE that module level names built with this function have to be passed to worker processes
+    explicitly since spawned processes re-import the test module and thus get another pid. the
+    prefix can be used as common pattern e.g. for the resource tracker. keep the prefix short
+    since e.g. macOS limits shared memory names to 31 characters
+    """
+    return f"{prefix}_{os.getpid()}"
@@ -2,15 +2,23 @@
 tests of basics (lock/release) of shmlock package
 """
 from multiprocessing import shared_memory
-import time
 import gc
+import copy
 import unittest
 import os
 import logging
 import tempfile
+import signal
+import sys
+import subprocess
+import textwrap
+from unittest.mock import MagicMock, patch
+from uuid import RFC_4122
 import shmlock
 import shmlock.shmlock_exceptions
 from shmlock.shmlock_uuid import ShmUuid
+from tests import unique_shm_name
+
 
 class BasicsTest(unittest.TestCase):
     """
@@ -32,7 +40,7 @@ class BasicsTest(unittest.TestCase):
         """
         test that the lock is released in the destructor
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
         lock1 = shmlock.ShmLock(shm_name)
         lock2 = shmlock.ShmLock(shm_name)
 
@@ -53,7 +61,7 @@ class BasicsTest(unittest.TestCase):
         """
         test some properties
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
         lock = shmlock.ShmLock(shm_name)
 
         self.assertTrue(lock.acquire())
@@ -66,7 +74,7 @@ class BasicsTest(unittest.TestCase):
         """
         test that lock is released even if an exception is raised
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
         lock = shmlock.ShmLock(shm_name)
 
         def test_func():
@@ -83,7 +91,7 @@ class BasicsTest(unittest.TestCase):
         """
         test that the lock is reentrant
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
         lock = shmlock.ShmLock(shm_name)
 
         with lock: # __enter__
@@ -106,7 +114,7 @@ class BasicsTest(unittest.TestCase):
         """
         test the basics
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
         lock = shmlock.ShmLock(shm_name)
 
         # check context managers
@@ -149,23 +157,27 @@ class BasicsTest(unittest.TestCase):
         self.assertFalse(lock2.release())
 
 
-        shm = None
-        with self.assertRaises(FileNotFoundError, msg = f"shm with name {shm_name} could not be "\
-                               "acquired, this means that it has not been properly "\
-                               "released by the locks!"):
-            # attach should fail because there is no shm to attach to
-            shm = shared_memory.SharedMemory(name=shm_name)
+        msg = f"shm with name {shm_name} could still be found, this means that it has not been "\
+               "properly released by the locks!"
+        if sys.platform.startswith("linux"):
+            # on linux a single stat of the mmap file is sufficient (and cheaper than attaching)
+            self.assertFalse(os.path.exists(os.path.join("/dev/shm", shm_name)), msg)
+        else:
+            shm = None
+            with self.assertRaises(FileNotFoundError, msg=msg):
+                # attach should fail because there is no shm to attach to
+                shm = shared_memory.SharedMemory(name=shm_name)
 
-        if shm is not None:
-            # juse in case, make sure that there are never leaking resources
-            shm.close()
-            shm.unlink()
+            if shm is not None:
+                # juse in case, make sure that there are never leaking resources
+                shm.close()
+                shm.unlink()
 
     def test_debug_get_uuid_of_locking_lock(self):
         """
         test the debug_get_uuid_of_locking_lock method
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
         lock = shmlock.ShmLock(shm_name)
         lock2 = shmlock.ShmLock(shm_name)
 
@@ -190,7 +202,7 @@ class BasicsTest(unittest.TestCase):
         """
         test the logger; logs will not be visible but for code coverage we add them
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
         lock = shmlock.ShmLock(shm_name)
 
         logger = logging.getLogger("test_logger")
@@ -227,7 +239,7 @@ class BasicsTest(unittest.TestCase):
         """
         test the logger None, i.e. no logger is set
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
         logger = logging.getLogger("test_logger_none") # we have to provide a logger,
                                                        # but it will not be used
         lock = shmlock.ShmLock(shm_name)
@@ -319,11 +331,32 @@ class BasicsTest(unittest.TestCase):
             self.assertEqual(assert_log.output,
                              ["ERROR:test_create_logger:logger test exception\nNoneType: None"])
 
+    def test_create_logger_coloredlogs(self):
+        """
+        test that coloredlogs is only used (and imported) if requested and available
+        """
+        coloredlogs_mock = MagicMock()
+        with patch.dict(sys.modules, {"coloredlogs": coloredlogs_mock}):
+            log = shmlock.create_logger(name="test_create_logger_coloredlogs",
+                                        use_colored_logs=False)
+            coloredlogs_mock.install.assert_not_called()
+
+            log = shmlock.create_logger(name="test_create_logger_coloredlogs",
+                                        use_colored_logs=True)
+            coloredlogs_mock.install.assert_called_once()
+            self.assertIs(coloredlogs_mock.install.call_args.kwargs["logger"], log)
+
+        # None in sys.modules makes the import fail i.e. coloredlogs is not available
+        with patch.dict(sys.modules, {"coloredlogs": None}):
+            log = shmlock.create_logger(name="test_create_logger_coloredlogs",
+                                        use_colored_logs=True)
+            self.assertEqual(len(log.handlers), 1)
+
     def test_repr(self):
         """
         test the repr method
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
         lock = shmlock.ShmLock(shm_name)
 
         # check that the repr method does not throw an exception
@@ -340,11 +373,50 @@ class BasicsTest(unittest.TestCase):
         self.assertEqual(uuid_str, ShmUuid.byte_to_string(uuid_bytes))
         self.assertIsNotNone(repr(uuid))
 
+    def test_uuid_equality_and_hash(self):
+        """
+        test equality and hash of uuid objects
+        """
+        uuid = ShmUuid()
+        uuid_copy = copy.copy(uuid)
+        other = ShmUuid()
+
+        self.assertEqual(uuid, uuid)
+        self.assertEqual(uuid, uuid_copy)
+        self.assertEqual(hash(uuid), hash(uuid_copy))
+        self.assertNotEqual(uuid, other)
+        self.assertNotEqual(uuid, uuid.uuid_str)
+        self.assertEqual(len({uuid, uuid_copy, other}), 2)
+
+    def test_uuid_version(self):
+        """
+        test that the uuid is a valid random (version 4, RFC 4122 variant) uuid
+        """
+        uuid = ShmUuid()
+        self.assertEqual(uuid.uuid_.version, 4)
+        self.assertEqual(uuid.uuid_.variant, RFC_4122)
+        self.assertEqual(uuid.uuid_str[14], "4")
+
+    def test_uuid_conversion_edge_cases(self):
+        """
+        test that uuid conversion methods reject malformed input and match uuid.UUID
+        """
+        uuid = ShmUuid()
+        self.assertEqual(ShmUuid.byte_to_string(uuid.uuid_bytes), str(uuid.uuid_))
+        self.assertEqual(ShmUuid.string_to_bytes(str(uuid.uuid_)), uuid.uuid_.bytes)
+
+        for bad in (b"invalid_bytes", b"", "not_a_uuid", ""):
+            # bytes are checked via byte_to_string, strings via string_to_bytes
+            convert = ShmUuid.byte_to_string if isinstance(bad, bytes) else \
+                ShmUuid.string_to_bytes
+            with self.subTest(bad=bad), self.assertRaises(ValueError):
+                convert(bad)
+
     def test_exceptions_at_release_within_contextmanager(self):
         """
         test that exceptions are raised if release is called within the context manager
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
         lock = shmlock.ShmLock(shm_name)
 
         with self.assertRaises(shmlock.shmlock_exceptions.ShmLockRuntimeError):
@@ -359,7 +431,7 @@ class BasicsTest(unittest.TestCase):
         """
         test acquirement with signal blocking
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
         lock = shmlock.ShmLock(shm_name, block_signals=True)
 
         try:
@@ -367,5 +439,73 @@ class BasicsTest(unittest.TestCase):
         finally:
             lock.release()
 
+    @unittest.skipUnless(os.name == "posix", "signal handlers only registered on posix")
+    def test_add_exit_handlers_idempotent(self):
+        """
+        test that repeated add_exit_handlers calls chain the previous signal handler only once
+        """
+        shm_name = unique_shm_name()
+        lock = shmlock.ShmLock(shm_name)
+
+        received = []
+        old_handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGINT,
+                                                               signal.SIGTERM,
+                                                               signal.SIGHUP,)}
+        signal.signal(signal.SIGTERM, lambda signum, frame: received.append(signum))
+        try:
+            for _ in range(2):
+                lock.add_exit_handlers(register_atexit=False,
+                                       register_weakref=False,
+                                       call_gc=False)
+
+            self.assertTrue(lock.acquire())
+            signal.raise_signal(signal.SIGTERM)
+
+            # lock released by handler and previous handler called exactly once
+            self.assertFalse(lock.acquired)
+            self.assertEqual(received, [signal.SIGTERM])
+        finally:
+            for sig, handler in old_handlers.items():
+                signal.signal(sig, handler)
+
+    @unittest.skipUnless(os.name == "posix", "signal handlers only registered on posix")
+    def test_add_exit_handlers_default_signal_handler(self):
+        """
+        test that with the default SIGTERM handler the process exits via SystemExit, i.e.
+        finally blocks and atexit handlers are still executed and the lock is released
+        """
+        shm_name = unique_shm_name()
+        script = textwrap.dedent(f"""
+            import atexit
+            import signal
+            import shmlock
+
+            atexit.register(print, "atexit", flush=True)
+            lock = shmlock.ShmLock({shm_name!r})
+            lock.add_exit_handlers(register_atexit=False, register_weakref=False, call_gc=False)
+            try:
+                assert lock.acquire()
+                signal.raise_signal(signal.SIGTERM)
+                print("not reached", flush=True)
+            finally:
+                print("finally", flush=True)
+            """)
+
+        res = subprocess.run([sys.executable, "-c", script],
+                             capture_output=True,
+                             text=True,
+                             timeout=30,
+                             check=False)
+
+        self.assertEqual(res.returncode, 128 + signal.SIGTERM, res.stderr)
+        self.assertEqual(res.stdout.split(), ["finally", "atexit"])
+
+        # lock has been released by the signal handler
+        lock = shmlock.ShmLock(shm_name)
+        try:
+            self.assertTrue(lock.acquire(timeout=False))
+        finally:
+            lock.release()
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -1,16 +1,26 @@
 """
 tests of some special cases which occurred on linux
+
+NOTE that each test uses its own shared memory name (pid, counter and monotonic time), so the
+tests neither depend on each other nor collide with tests of other processes i.e. they can be
+executed in parallel (e.g. by a parallel test runner or multiple test runs on the same machine).
 """
 import sys
-import time
 import os
+import stat
 import unittest
-from multiprocessing import shared_memory
+import warnings
+from multiprocessing import shared_memory, resource_tracker
 import shmlock
 import shmlock.shmlock_exceptions
 import shmlock.shmlock_main
 from shmlock.shmlock_main import remove_shm_from_resource_tracker
+from shmlock import shmlock_monkey_patch
 from shmlock.shmlock_monkey_patch import _PATTERN_LIST
+from tests import unique_shm_name
+
+# version check evaluated once for the skip decorators
+_PY313 = sys.version_info >= (3, 13)
 
 class LinuxPosixTests(unittest.TestCase):
     """
@@ -22,29 +32,53 @@ class LinuxPosixTests(unittest.TestCase):
         _description_
     """
 
+    _shm_location = os.path.abspath("/dev/shm")
+
     def __init__(self, *args, **kwargs):
         """
         test init method
         """
-        self._shm_location = os.path.abspath("/dev/shm")
         self._shm_name = None
+        self._shm_path = None
+        self._lock = None
         super().__init__(*args, **kwargs)
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        check shm location once for all tests
+        """
+        if sys.platform.startswith("linux"):
+            # there is one test to be executed outside linux so we need this special check
+            cls().assertTrue(os.path.exists(cls._shm_location), "shm location does not exist")
+
     def setUp(self):
         """
         set up the test case
         """
-        self._shm_name = str(time.time())
+        self._shm_name = unique_shm_name()
+        self._shm_path = os.path.join(self._shm_location, self._shm_name)
+        # lock (not acquired) for the current shm name which is used by all tests
+        self._lock = shmlock.ShmLock(self._shm_name)
 
-        if sys.platform.startswith("linux"):
-            # there is one test to be executed outside linux so we need this special check
-            self.assertTrue(os.path.exists(self._shm_location), "shm location does not exist")
+    def tearDown(self):
+        """
+        release the lock in case a test acquired it; NOTE that unittest keeps the test case
+        instances alive so we cannot rely on the destructor of the lock here
+        """
+        self._lock.release(force=True)
+        self._lock = None
 
-            l = shmlock.ShmLock(self._shm_name)
-            with l:
-                # file should be generated at desired location
-                self.assertTrue(os.path.isfile(os.path.join(self._shm_location,
-                                                            self._shm_name)))
+    @unittest.skipUnless(sys.platform.startswith("linux"), "test only for linux")
+    def test_setup_creates_file(self):
+        """
+        test that acquiring the lock creates the shm file at the expected location
+        """
+        with self._lock:
+            # file should be generated at desired location; NOTE os.stat raises (with the path)
+            # if the file does not exist instead of silently returning False
+            self.assertTrue(stat.S_ISREG(os.stat(self._shm_path).st_mode))
+        self.assertFalse(os.path.exists(self._shm_path))
 
     @unittest.skipUnless(sys.platform.startswith("linux"), "test only for linux")
     def test_empty_shared_memory_file(self):
@@ -52,63 +86,52 @@ class LinuxPosixTests(unittest.TestCase):
         test empty shm lock file
         """
 
-        l = shmlock.ShmLock(self._shm_name)
-
         # create empty file to fake flawed shared memory file to which shared memory cannot attach
-        with open(os.path.join(self._shm_location,
-                               self._shm_name), "w+", encoding="utf-8") as _:
-            pass
+        os.close(os.open(self._shm_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600))
+        # the fake file cannot be unlinked via shared memory; remove it after the test
+        self.addCleanup(os.remove, self._shm_path)
 
         with self.assertRaises(shmlock.shmlock_exceptions.ShmLockValueError):
             # query for error if empty file exists should raise ShmLockValueError
-            l.query_for_error_after_interrupt()
+            self._lock.query_for_error_after_interrupt()
 
     @unittest.skipUnless(sys.platform.startswith("linux"), "test only for linux")
     def test_empty_uuid_in_created_file(self):
         """
         test empty uuid in created file
         """
-        l = shmlock.ShmLock(self._shm_name)
-
         # fake creation of block but lock did not write its uuid to the file. this happens
         # if the process is interrupted right after creation of shared memory file
-        shm = None
-        try:
-            shm = shared_memory.SharedMemory(name=self._shm_name,
-                                            create=True,
-                                            size=shmlock.shmlock_main.LOCK_SHM_SIZE)
-
-            with self.assertRaises(shmlock.shmlock_exceptions.ShmLockDanglingSharedMemoryError):
-                # query for error if empty file exists should raise
-                # ShmLockDanglingSharedMemoryError
-                l.query_for_error_after_interrupt()
-
-        finally:
-            if shm is not None:
-                shm.close()
-                shm.unlink()
+        shm = shared_memory.SharedMemory(name=self._shm_name,
+                                         create=True,
+                                         size=shmlock.shmlock_main.LOCK_SHM_SIZE)
+        # cleanups are executed in LIFO order, i.e. close before unlink
+        self.addCleanup(shm.unlink)
+        self.addCleanup(shm.close)
+
+        with self.assertRaises(shmlock.shmlock_exceptions.ShmLockDanglingSharedMemoryError):
+            # query for error if empty file exists should raise
+            # ShmLockDanglingSharedMemoryError
+            self._lock.query_for_error_after_interrupt()
 
     def test_error_function_if_lock_acquired(self):
         """
         test that query for error raises an exception if lock is acquired
         """
-        l = shmlock.ShmLock(self._shm_name)
-
-        with l:
+        with self._lock:
             with self.assertRaises(shmlock.shmlock_exceptions.ShmLockRuntimeError):
                 # query for error only allowed for unlocked locks because
                 # acquired locks are seemingly working fine
-                l.query_for_error_after_interrupt()
+                self._lock.query_for_error_after_interrupt()
 
     def test_query_function(self):
         """
         test that query for error raises an exception if lock is acquired
         """
-        l1 = shmlock.ShmLock(self._shm_name)
         l2 = shmlock.ShmLock(self._shm_name)
 
         # acquire lock
-        l1.acquire()
+        self._lock.acquire()
 
         # l2 should now cleanly proceed and not throw anything
         l2.query_for_error_after_interrupt()
@@ -118,9 +141,9 @@ class LinuxPosixTests(unittest.TestCase):
         """
         test that query for error does not raise an exception if all is fine and returns None
         """
-        l = shmlock.ShmLock(self._shm_name)
-        self.assertIsNone(l.query_for_error_after_interrupt())
+        self.assertIsNone(self._lock.query_for_error_after_interrupt())
 
+    @unittest.skipIf(_PY313, "resource tracker monkey patch not supported for python >= 3.13")
     def test_monkey_patch(self):
         """
         test monkey patching of the lock
@@ -132,24 +155,65 @@ class LinuxPosixTests(unittest.TestCase):
         NOTE that the patch makes only sense on posix systems. But we execute it on all systems
         """
 
-        l = shmlock.ShmLock(self._shm_name)
+        remove_shm_from_resource_tracker(self._lock.name)
+
+        self.assertTrue(len(_PATTERN_LIST) > 0, "monkey patching did not work")
+        self.assertTrue(self._lock.name in _PATTERN_LIST)
+
+        with self.assertRaises(ValueError):
+            # pattern must be a string
+            remove_shm_from_resource_tracker(1)
+
+    @unittest.skipIf(_PY313, "monkey patching not supported for python >= 3.13")
+    def test_monkey_patch_empty_pattern_warns_once(self):
+        """
+        test that the warning for an empty pattern is only emitted once per process
+        """
+        # NOTE that an empty pattern disables tracking of all shared memory blocks, so the state
+        # of the monkey patch module and the resource tracker is restored afterwards
+        cleanup_funcs = resource_tracker._CLEANUP_FUNCS # pylint: disable=protected-access
+        self.addCleanup(cleanup_funcs.update, dict(cleanup_funcs))
+        # pylint: disable=(protected-access)
+        self.addCleanup(self._remove_empty_patterns, shmlock_monkey_patch._WARNED_NON_POSIX)
+        shmlock_monkey_patch._WARNED_EMPTY_PATTERN = False
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            remove_shm_from_resource_tracker("", print_warning=True)
+            remove_shm_from_resource_tracker("", print_warning=True)
 
-        if sys.version_info >= (3, 13):
-            with self.assertRaises(RuntimeError):
-                # in python 3.13 and above shared memory blocks contain the track parameter
-                # which can also be used in the ShmLock object. Use ShmLock(..., track=False) so
-                # that shared memory block will not be tracked by the resource tracker
-                remove_shm_from_resource_tracker(l.name)
-        else:
+        # only count the empty pattern warning since e.g. on windows the non-posix warning is
+        # emitted as well, depending on whether another test already triggered it
+        messages = [str(w.message) for w in caught]
+        self.assertEqual(messages.count(shmlock_monkey_patch._WARNING_EMPTY_PATTERN), 1, messages)
 
-            remove_shm_from_resource_tracker(l.name)
+    @staticmethod
+    def _remove_empty_patterns(warned_non_posix: bool):
+        """
+        remove empty patterns from the monkey patch module and reset the warned flags
 
-            self.assertTrue(len(_PATTERN_LIST) > 0, "monkey patching did not work")
-            self.assertTrue(l.name in _PATTERN_LIST)
+        Parameters
+        ----------
+        warned_non_posix : bool
+            value of the non-posix warned flag before the test
+        """
+        # pylint: disable=(protected-access)
+        with shmlock_monkey_patch._THREADING_LOCK:
+            _PATTERN_LIST[:] = [pattern for pattern in _PATTERN_LIST if pattern]
+            shmlock_monkey_patch._PATTERN_TUPLE = tuple(_PATTERN_LIST)
+            shmlock_monkey_patch._WARNED_EMPTY_PATTERN = False
+            shmlock_monkey_patch._WARNED_NON_POSIX = warned_non_posix
 
-            with self.assertRaises(ValueError):
-                # pattern must be a string
-                remove_shm_from_resource_tracker(1)
+    @unittest.skipUnless(_PY313, "test only for python >= 3.13")
+    def test_monkey_patch_not_supported(self):
+        """
+        test that monkey patching raises for python 3.13 and above
+        """
+        with self.assertRaises(RuntimeError):
+            # in python 3.13 and above shared memory blocks contain the track parameter
+            # which can also be used in the ShmLock object. Use ShmLock(..., track=False) so
+            # that shared memory block will not be tracked by the resource tracker
+            remove_shm_from_resource_tracker(self._lock.name)
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -6,9 +6,13 @@ import time
 import threading
 import multiprocessing
 import logging
+from unittest.mock import patch
 import shmlock
+import shmlock.shmlock_config
+from tests import pid_shm_name
 
-LOCK_NAME = "test_exit_event_lock_shm"
+# see pid_shm_name for details
+LOCK_NAME = pid_shm_name("test_exit_event")
 
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger("TestLogger")
@@ -71,6 +75,32 @@ class ExitEventTest(unittest.TestCase):
         thread.join(timeout=2) # give thread some time to finish
         self.assertFalse(thread.is_alive(), "thread is still alive")
 
+    def test_exit_event_mock(self):
+        """
+        test the mock exit event without actually sleeping; sleep is patched so that
+        only the requested sleep time is verified
+        """
+        mock_event = shmlock.shmlock_config.ExitEventMock()
+        self.assertFalse(mock_event.is_set())
+
+        with patch("shmlock.shmlock_config.time.sleep") as mock_sleep:
+            # not set -> wait sleeps for the given time
+            mock_event.wait(0.1)
+            mock_sleep.assert_called_once_with(0.1)
+
+            # set -> wait returns immediately
+            mock_sleep.reset_mock()
+            mock_event.set()
+            self.assertTrue(mock_event.is_set())
+            mock_event.wait(0.1)
+            mock_sleep.assert_not_called()
+
+            # cleared -> wait sleeps again
+            mock_event.clear()
+            self.assertFalse(mock_event.is_set())
+            mock_event.wait(0.1)
+            mock_sleep.assert_called_once_with(0.1)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -5,11 +5,12 @@ import multiprocessing
 import threading
 from multiprocessing import shared_memory
 import sys
-import time
 import unittest
 import shmlock
 import shmlock.shmlock_exceptions
 import shmlock.shmlock_config
+from tests import unique_shm_name
+
 
 class InitTest(unittest.TestCase):
     """
@@ -31,7 +32,7 @@ class InitTest(unittest.TestCase):
         """
         check if init works with default values
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
         lock = shmlock.ShmLock(shm_name, poll_interval=1)
         self.assertEqual(lock.name, shm_name)
         self.assertEqual(lock.poll_interval, 1)
@@ -49,7 +50,7 @@ class InitTest(unittest.TestCase):
         """
         check that locked and acquired properties work correctly
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
         lock = shmlock.ShmLock(shm_name, poll_interval=1)
         self.assertFalse(lock.locked)
         self.assertFalse(lock.acquired)
@@ -68,7 +69,7 @@ class InitTest(unittest.TestCase):
         """
         test if event types are correctly set
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
 
         for event in (multiprocessing.Event(), threading.Event(),):
             lock = shmlock.ShmLock(shm_name, exit_event=event)
@@ -109,7 +110,7 @@ class InitTest(unittest.TestCase):
         """
         test if unknown parameters are caught and TypeError is raised
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
 
         with self.assertRaises(TypeError):
             shmlock.ShmLock(shm_name, unknown_param=1) # pylint: disable=unexpected-keyword-arg
@@ -118,7 +119,7 @@ class InitTest(unittest.TestCase):
         """
         test if wrong parameter types are caught
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
 
         with self.assertRaises(shmlock.shmlock_exceptions.ShmLockValueError):
             shmlock.ShmLock(shm_name, poll_interval=None)
@@ -138,7 +139,7 @@ class InitTest(unittest.TestCase):
         it will lead to high cpu usage and takes a long time. thus we prevent it explicitly.
         Test for int and float
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
 
         with self.assertRaises(shmlock.shmlock_exceptions.ShmLockValueError):
             shmlock.ShmLock(shm_name, poll_interval=0)
@@ -150,7 +151,7 @@ class InitTest(unittest.TestCase):
         """
         test if negative poll interval is caught
         """
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
         with self.assertRaises(shmlock.shmlock_exceptions.ShmLockValueError):
             shmlock.ShmLock(shm_name, poll_interval=-1)
 
@@ -163,7 +164,7 @@ class InitTest(unittest.TestCase):
 
     @unittest.skipUnless(sys.version_info < (3, 13), "test only for lower python versions")
     def test_track_for_too_low_version(self):
-        shm_name = str(time.time())
+        shm_name = unique_shm_name()
         # this is not a valid test since the version is too low
         if sys.version_info < (3, 13):
             with self.assertRaises(ValueError):
@@ -21,11 +21,13 @@ import struct
 import threading
 import logging
 import shmlock
+from tests import pid_shm_name
 
 NUM_PROCESSES = 15
 NUM_RUNS = 2000
-LOCK_NAME = "shm_lock_test_lock_shm"
-RESULT_SHM_NAME = "shm_lock_result_shm"
+# see pid_shm_name for details; names are passed to the workers via ArgumentsCollector
+LOCK_NAME = pid_shm_name("shm_lock_test_lock")
+RESULT_SHM_NAME = pid_shm_name("shm_lock_result")
 
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger("TestLogger")
@@ -55,7 +57,7 @@ if os.name == "posix":
 else:
     log_buffer.get("info").append("Not removing shared memory from resource tracker\n\n")
 
-class ArgumentsCollector: # pylint: disable=too-few-public-methods
+class ArgumentsCollector: # pylint: disable=(too-few-public-methods, too-many-instance-attributes)
     """
     just a little helper class to collect arguments for multiprocessing tests
     """
@@ -71,6 +73,8 @@ class ArgumentsCollector: # pylint: disable=too-few-public-methods
         failed_acquire_queue to store failed acquirements
         poll_interval for lock
         time_measure_queue to store time measurements
+        lock_name name of the lock used by all workers
+        result_shm_name name of the result shared memory
         """
         self.start_event = None
         self.use_lock_function = None
@@ -78,6 +82,8 @@ class ArgumentsCollector: # pylint: disable=too-few-public-methods
         self.failed_acquire_queue = None
         self.poll_interval = None
         self.time_measure_queue = None
+        self.lock_name = None
+        self.result_shm_name = None
 
 
 def worker(arg_collector: ArgumentsCollector):
@@ -99,13 +105,14 @@ def worker(arg_collector: ArgumentsCollector):
     time_measure_queue : multiprocessing.Queue = arg_collector.time_measure_queue
 
     start_event.wait() # to synchronize start of all processes
-    shm = shared_memory.SharedMemory(name=RESULT_SHM_NAME)
+    shm = shared_memory.SharedMemory(name=arg_collector.result_shm_name)
     if poll_interval is not None:
-        obj = shmlock.ShmLock(LOCK_NAME,
+        obj = shmlock.ShmLock(arg_collector.lock_name,
                               poll_interval=poll_interval,
                               track=False if sys.version_info >= (3, 13) else None)
     else:
-        obj = shmlock.ShmLock(LOCK_NAME, track=False if sys.version_info >= (3, 13) else None)
+        obj = shmlock.ShmLock(arg_collector.lock_name,
+                              track=False if sys.version_info >= (3, 13) else None)
 
     time_measurement = []
     failed_acquirements = 0
@@ -205,6 +212,8 @@ class FunctionalTest(unittest.TestCase):
         self.args = ArgumentsCollector()
         self.args.time_measure_queue = self.time_measurement_queue
         self.args.failed_acquire_queue = self.failure_count_queue
+        self.args.lock_name = LOCK_NAME
+        self.args.result_shm_name = RESULT_SHM_NAME
 
     # @unittest.skip("skip for now")
     def test_lock_function_timeout_none(self):
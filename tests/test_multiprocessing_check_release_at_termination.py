@@ -13,33 +13,42 @@ https://github.com/vllm-project/vllm/pull/5512
 import sys
 import os
 import multiprocessing
+import multiprocessing.synchronize
 import unittest
+import threading
 import time
 import signal
 import shmlock
+from tests import pid_shm_name
 
 
-LOCK_NAME = "test_lock_name"
+# see pid_shm_name for details; the prefix is the resource tracker pattern
+LOCK_NAME_PREFIX = "test_lock_name"
+LOCK_NAME = pid_shm_name(LOCK_NAME_PREFIX)
 
 
 if os.name == "posix":
-    if sys.version_info >= (3, 12, 0):
-        # for 3.12.5 there is a deprecation warning concerning fork method and threads.
-        # so we set it to spawn here
-        multiprocessing.set_start_method("spawn", force=True)
+    # NOTE that fork is avoided (for 3.12.5 there is a deprecation warning concerning fork
+    # method and threads). forkserver children do not copy the test runner process. the server
+    # is not configured to preload shmlock since that would change the (process-wide) forkserver
+    # state for all other tests
+    MP_CONTEXT = multiprocessing.get_context("forkserver")
 
     # otherwise it spams KeyErrors since resource tracker also tracks shm of other processes
     # and complains that it has not been unlinked because it was unlinked by another process
     if sys.version_info < (3, 13):
         # NOTE that this is not necessary for python 3.13 and above since there is the track
         # parameter to deactivate tracking
-        shmlock.remove_shm_from_resource_tracker(LOCK_NAME)
+        shmlock.remove_shm_from_resource_tracker(LOCK_NAME_PREFIX)
+else:
+    MP_CONTEXT = multiprocessing.get_context("spawn")
 
-def acquire_lock_worker():
+def acquire_lock_worker(lock_name: str, acquired_event: multiprocessing.synchronize.Event):
     """
-    acquire lock indefinitely until terminated
+    acquire lock indefinitely until terminated; acquired_event is set as soon as the lock
+    has been acquired
     """
-    s = shmlock.ShmLock(LOCK_NAME, track=False if sys.version_info >= (3, 13) else None)
+    s = shmlock.ShmLock(lock_name, track=False if sys.version_info >= (3, 13) else None)
 
     def cleanup(signum, frame): # pylint:disable=(unused-argument)
         s.release(force=True)
@@ -47,10 +56,24 @@ def acquire_lock_worker():
 
     signal.signal(signal.SIGTERM, cleanup)
     with s:
-        while True:
-            pass
+        acquired_event.set()
+        # block (without using cpu) until terminated; NOTE that the signal handler is still
+        # executed since waiting on a lock can be interrupted by signals
+        threading.Event().wait()
 
 
+def hold_lock_worker(lock_name: str,
+                     hold: float,
+                     acquired_event: multiprocessing.synchronize.Event):
+    """
+    acquire lock, hold it for the given time in seconds and release it via the regular
+    __exit__ path; acquired_event is set as soon as the lock has been acquired
+    """
+    s = shmlock.ShmLock(lock_name, track=False if sys.version_info >= (3, 13) else None)
+    with s:
+        acquired_event.set()
+        time.sleep(hold)
+
 
 class TestReleaseAtTermination(unittest.TestCase):
     """
@@ -71,22 +94,56 @@ class TestReleaseAtTermination(unittest.TestCase):
 
         # create a lock and a process
         l = shmlock.ShmLock(LOCK_NAME, track=False if sys.version_info >= (3, 13) else None)
-        p = multiprocessing.Process(target=acquire_lock_worker)
+        acquired_event = MP_CONTEXT.Event()
+        p = MP_CONTEXT.Process(target=acquire_lock_worker, args=(LOCK_NAME, acquired_event,))
 
         p.start()
-        time.sleep(1)
+        self.assertTrue(acquired_event.wait(5), "Process did not acquire the lock in time")
 
         # check that process as started and lock has been acquired by the process
         self.assertTrue(p.is_alive(), "Process is not alive after start")
         self.assertFalse(l.acquire(timeout=False), "lock should be acquired by the process")
 
-        # termiante the process
+        # termiante the process; join with timeout so that a hanging release does not block
+        # the test run. kill as fallback (the assertion below will fail in this case)
         p.terminate()
-        p.join()
+        p.join(timeout=5)
+        if p.is_alive():
+            p.kill()
+            p.join(timeout=1)
 
         # check that signal works to release the lock
         self.assertFalse(p.is_alive(), "Process is still alive after termination")
-        self.assertTrue(l.acquire(timeout=1), "Lock not released after process termination")
+        if sys.platform.startswith("linux"):
+            # observe the release directly instead of polling for the lock
+            self.assertFalse(os.path.exists(os.path.join("/dev/shm", LOCK_NAME)),
+                             "Lock not released after process termination")
+        self.assertTrue(l.acquire(timeout=0.1), "Lock not released after process termination")
+
+    def test_release_after_hold(self):
+        """
+        check that a lock held by another process for a bounded time is released on regular
+        process exit (without termination; works the same way on all platforms)
+        """
+        l = shmlock.ShmLock(LOCK_NAME, track=False if sys.version_info >= (3, 13) else None)
+        acquired_event = MP_CONTEXT.Event()
+        p = MP_CONTEXT.Process(target=hold_lock_worker, args=(LOCK_NAME, 1.0, acquired_event,))
+
+        p.start()
+        self.assertTrue(acquired_event.wait(5), "Process did not acquire the lock in time")
+        self.assertFalse(l.acquire(timeout=False), "lock should be acquired by the process")
+
+        # process should exit on its own after releasing the lock
+        p.join(timeout=5)
+        if p.is_alive():
+            p.kill()
+            p.join(timeout=1)
+
+        self.assertEqual(p.exitcode, 0, "Process did not exit cleanly")
+        try:
+            self.assertTrue(l.acquire(timeout=0.1), "Lock not released after process exit")
+        finally:
+            l.release()
 
 
 if __name__ == "__main__":